@@ -1,9 +1,21 @@
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
-from backend.routes import auth_routes, notes_routes
+from backend.routes import auth_routes, notes_routes, health_routes
+from backend.utils.db_connection import mongo
 
-app = FastAPI(title="NoteVault API")
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # create the MongoClient on startup rather than at import time
+    mongo.connect()
+    yield
+    mongo.close()
+
+
+app = FastAPI(title="NoteVault API", lifespan=lifespan)
 
 app.include_router(auth_routes.router)
 app.include_router(notes_routes.router)
+app.include_router(health_routes.router)
 
 # For testing: run `uvicorn backend.main:app --reload --port 8000`
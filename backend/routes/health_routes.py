@@ -0,0 +1,29 @@
+from fastapi import APIRouter
+from fastapi.responses import JSONResponse
+from backend.utils.db_connection import mongo
+import logging
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter(prefix="/api/health")
+
+
+@router.get("")
+def health():
+    """Liveness check. Doesn't touch the database, just reports pool utilisation."""
+    return {"status": "ok", "pool": mongo.pool_stats()}
+
+
+@router.get("/ready")
+def ready():
+    """Readiness check: the app is ready once MongoDB answers a ping."""
+    try:
+        mongo.ping()
+    except Exception:
+        # the error text includes the replica set topology, so only log it
+        logger.exception("MongoDB readiness ping failed")
+        return JSONResponse(
+            status_code=503,
+            content={"status": "unavailable", "pool": mongo.pool_stats()},
+        )
+    return {"status": "ready", "pool": mongo.pool_stats()}
@@ -1,6 +1,6 @@
 from fastapi import APIRouter, Form, File, UploadFile, HTTPException, Response
 import os
-from backend.services.notes_service import save_note, get_notes, fs
+from backend.services.notes_service import save_note, get_notes, get_file
 from backend.services.notes_service import delete_note, search_notes
 from bson.objectid import ObjectId
 
@@ -31,9 +31,8 @@ def download_file(file_id: str):
     except Exception:
         raise HTTPException(status_code=400, detail="Invalid file id")
 
-    try:
-        grid_out = fs.get(oid)
-    except Exception:
+    grid_out = get_file(oid)
+    if grid_out is None:
         raise HTTPException(status_code=404, detail="File not found")
 
     # Try to find note metadata to get a better filename (with extension)
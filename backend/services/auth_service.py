@@ -1,7 +1,8 @@
-from backend.utils.db_connection import users_collection
+from backend.utils.db_connection import get_users_collection
 from werkzeug.security import generate_password_hash, check_password_hash
 
 def create_user(username, email, password):
+    users_collection = get_users_collection()
     # Check if user already exists
     if users_collection.find_one({"username": username}):
         return {"error": "Username already exists."}
@@ -12,6 +13,7 @@ def create_user(username, email, password):
     return {"message": "User registered successfully."}
 
 def verify_user(username, password):
+    users_collection = get_users_collection()
     user = users_collection.find_one({"username": username})
     if not user:
         return {"error": "User not found."}
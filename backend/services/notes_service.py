@@ -2,8 +2,9 @@ import io
 import os
 import mimetypes
 from datetime import datetime
-from backend.utils.db_connection import db
+from backend.utils.db_connection import get_db, get_read_db
 from gridfs import GridFS
+from gridfs.errors import NoFile
 from pymongo.collection import Collection
 from bson.objectid import ObjectId
 import logging
@@ -13,8 +14,23 @@ if not logger.handlers:
     # basic configuration; uvicorn/fastapi will integrate its own handlers in production
     logging.basicConfig(level=logging.INFO)
 
-notes_collection: Collection = db["notes"]
-fs = GridFS(db)
+
+def _notes_collection() -> Collection:
+    """Notes collection on the primary, for writes and read-then-write lookups."""
+    return get_db()["notes"]
+
+
+def _read_notes_collection() -> Collection:
+    """Notes collection using the configured read preference, for listings and searches."""
+    return get_read_db()["notes"]
+
+
+def _fs() -> GridFS:
+    return GridFS(get_db())
+
+
+def _read_fs() -> GridFS:
+    return GridFS(get_read_db())
 
 
 def _read_file_bytes(file):
@@ -113,6 +129,7 @@ def save_note(username, note_type, content=None, file=None, title=None):
         note_data["extension"] = ext.lstrip('.') if ext else ''
 
         # store file in GridFS
+        fs = _fs()
         try:
             # Store file into GridFS. Include original filename and extension in metadata so
             # downloads can use the proper filename and extension.
@@ -179,7 +196,7 @@ def save_note(username, note_type, content=None, file=None, title=None):
 
     # insert into notes collection
     try:
-        notes_collection.insert_one(note_data)
+        _notes_collection().insert_one(note_data)
     except Exception as e:
         return {"error": f"Failed to save note metadata: {str(e)}"}
 
@@ -203,6 +220,7 @@ def get_notes(username, page: int = 1, per_page: int = 10, sort: str = "desc"):
     sort_dir = -1 if str(sort).lower() != "asc" else 1
 
     query = {"username": username}
+    notes_collection = _read_notes_collection()
     total = notes_collection.count_documents(query)
     cursor = notes_collection.find(query).sort("timestamp", sort_dir).skip((page - 1) * per_page).limit(per_page)
 
@@ -220,26 +238,47 @@ def get_notes(username, page: int = 1, per_page: int = 10, sort: str = "desc"):
 
 
 def get_note_by_file_id(file_id):
-    """Return the note document (without _id) matching a GridFS file_id if present."""
+    """Return the note document (without _id) matching a GridFS file_id if present.
+
+    Reads from the primary: this runs for downloads of files that may have only
+    just been uploaded, and a single-document lookup gains little from a secondary.
+    """
     try:
         oid = ObjectId(file_id)
     except Exception:
         return None
-    doc = notes_collection.find_one({"file_id": oid}, {"_id": 0})
+    doc = _notes_collection().find_one({"file_id": oid}, {"_id": 0})
     return doc
 
 
+def get_file(file_id):
+    """Return the GridFS file for file_id, or None if it doesn't exist.
+
+    Reads go through the configured read preference first; a file that was only
+    just uploaded may not have replicated yet, so a miss is retried on the primary.
+    """
+    oid = file_id if isinstance(file_id, ObjectId) else ObjectId(file_id)
+    for fs in (_read_fs(), _fs()):
+        try:
+            return fs.get(oid)
+        except NoFile:
+            continue
+    return None
+
+
 def delete_note(note_id):
     """Delete a note document and any GridFS file it references. Returns True if deleted."""
     try:
         oid = ObjectId(note_id)
     except Exception:
         return False
+    notes_collection = _notes_collection()
     doc = notes_collection.find_one({"_id": oid})
     if not doc:
         return False
     # If there's a file_id stored, try to delete the GridFS file too
     file_ref = doc.get("file_id")
+    fs = _fs()
     try:
         if file_ref:
             if isinstance(file_ref, ObjectId):
@@ -287,6 +326,7 @@ def search_notes(username, q, page: int = 1, per_page: int = 10, sort: str = "de
         per_page = 10
 
     sort_dir = -1 if str(sort).lower() != "asc" else 1
+    notes_collection = _read_notes_collection()
     total = notes_collection.count_documents(query)
     cursor = notes_collection.find(query).sort("timestamp", sort_dir).skip((page - 1) * per_page).limit(per_page)
 
@@ -1,8 +1,213 @@
+import threading
 from pymongo import MongoClient
+from pymongo import monitoring
+from pymongo.collection import Collection
 from pymongo.database import Database
-from config.settings import MONGO_URI
+from pymongo.read_preferences import (
+    Nearest,
+    Primary,
+    PrimaryPreferred,
+    Secondary,
+    SecondaryPreferred,
+)
+from config import settings
 
-client = MongoClient(MONGO_URI)
-# annotate db as Database so type-checkers (Pylance) understand indexing on it
-db: Database = client["notevault"]
-users_collection = db["users"]
+_READ_PREFERENCES = {
+    "primary": Primary,
+    "primaryPreferred": PrimaryPreferred,
+    "secondary": Secondary,
+    "secondaryPreferred": SecondaryPreferred,
+    "nearest": Nearest,
+}
+
+
+def _build_read_preference(name, max_staleness):
+    """Turn a read preference name from settings into a pymongo read preference."""
+    mode = _READ_PREFERENCES.get(name)
+    if mode is None:
+        raise ValueError(f"Unknown MONGO_READ_PREFERENCE: {name!r}")
+    if max_staleness != -1 and max_staleness < 90:
+        # pymongo only rejects this during server selection, i.e. on the first secondary read
+        raise ValueError(f"MONGO_MAX_STALENESS_SECONDS must be -1 or at least 90, got {max_staleness}")
+    if mode is Primary:
+        # primary reads never go to a secondary, so staleness doesn't apply
+        return Primary()
+    return mode(max_staleness=max_staleness)
+
+
+class PoolStatsListener(monitoring.ConnectionPoolListener):
+    """Keeps per-server counts of open and checked-out connections.
+
+    pymongo doesn't expose pool utilisation directly, so we track it from the
+    connection pool events it publishes.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._pools = {}
+
+    def _adjust(self, address, key, delta):
+        # events can still arrive after pool_closed (e.g. during client.close());
+        # only count them for pools we're tracking so closed pools aren't resurrected
+        with self._lock:
+            pool = self._pools.get(address)
+            if pool is not None:
+                pool[key] = max(pool[key] + delta, 0)
+
+    def pool_created(self, event):
+        with self._lock:
+            self._pools[event.address] = {"open": 0, "in_use": 0}
+
+    def pool_ready(self, event):
+        pass
+
+    def pool_cleared(self, event):
+        pass
+
+    def pool_closed(self, event):
+        with self._lock:
+            self._pools.pop(event.address, None)
+
+    def connection_created(self, event):
+        self._adjust(event.address, "open", 1)
+
+    def connection_ready(self, event):
+        pass
+
+    def connection_closed(self, event):
+        self._adjust(event.address, "open", -1)
+
+    def connection_check_out_started(self, event):
+        pass
+
+    def connection_check_out_failed(self, event):
+        pass
+
+    def connection_checked_out(self, event):
+        self._adjust(event.address, "in_use", 1)
+
+    def connection_checked_in(self, event):
+        self._adjust(event.address, "in_use", -1)
+
+    def snapshot(self):
+        with self._lock:
+            return {address: dict(counts) for address, counts in self._pools.items()}
+
+
+class MongoConnectionManager:
+    """Owns the MongoClient for the app and creates it on first use.
+
+    Nothing touches the network (or even parses MONGO_URI, which can mean a DNS
+    lookup for mongodb+srv URIs) until connect() is called, either from app
+    startup or from the first request that needs the database.
+    """
+
+    def __init__(self, uri=None, db_name=None):
+        self._uri = uri
+        self._db_name = db_name
+        self._client = None
+        self._read_preference = None
+        self._pool_listener = PoolStatsListener()
+        self._lock = threading.Lock()
+
+    @property
+    def is_connected(self):
+        return self._client is not None
+
+    def connect(self) -> MongoClient:
+        """Create the MongoClient if it doesn't exist yet and return it."""
+        if self._client is not None:
+            return self._client
+        with self._lock:
+            if self._client is None:
+                self._read_preference = _build_read_preference(
+                    settings.MONGO_READ_PREFERENCE, settings.MONGO_MAX_STALENESS_SECONDS
+                )
+                self._client = MongoClient(
+                    self._uri or settings.MONGO_URI,
+                    maxPoolSize=settings.MONGO_MAX_POOL_SIZE,
+                    minPoolSize=settings.MONGO_MIN_POOL_SIZE,
+                    maxIdleTimeMS=settings.MONGO_MAX_IDLE_TIME_MS,
+                    connectTimeoutMS=settings.MONGO_CONNECT_TIMEOUT_MS,
+                    serverSelectionTimeoutMS=settings.MONGO_SERVER_SELECTION_TIMEOUT_MS,
+                    socketTimeoutMS=settings.MONGO_SOCKET_TIMEOUT_MS,
+                    waitQueueTimeoutMS=settings.MONGO_WAIT_QUEUE_TIMEOUT_MS,
+                    compressors=settings.MONGO_COMPRESSORS,
+                    event_listeners=[self._pool_listener],
+                )
+        return self._client
+
+    def close(self):
+        with self._lock:
+            if self._client is not None:
+                self._client.close()
+                self._client = None
+
+    @property
+    def client(self) -> MongoClient:
+        return self.connect()
+
+    @property
+    def db(self) -> Database:
+        """Database handle that reads from the primary. Use for writes and read-your-write lookups."""
+        return self.client[self._db_name or settings.MONGO_DB_NAME]
+
+    @property
+    def read_db(self) -> Database:
+        """Database handle using the configured read preference (secondaries by default)."""
+        client = self.client
+        return client.get_database(
+            self._db_name or settings.MONGO_DB_NAME, read_preference=self._read_preference
+        )
+
+    def ping(self):
+        """Run a ping against the deployment; raises if no server is reachable."""
+        return self.client.admin.command("ping")
+
+    def pool_stats(self, include_servers=False):
+        """Report connection pool utilisation in total, and per server if include_servers is set.
+
+        The per-server breakdown is keyed by host:port, so keep it out of public responses.
+        """
+        max_pool_size = settings.MONGO_MAX_POOL_SIZE
+        servers = {}
+        total_open = total_in_use = 0
+        for (host, port), counts in self._pool_listener.snapshot().items():
+            servers[f"{host}:{port}"] = {
+                "open": counts["open"],
+                "in_use": counts["in_use"],
+                "available": max(counts["open"] - counts["in_use"], 0),
+                "max_pool_size": max_pool_size,
+                "utilisation": round(counts["in_use"] / max_pool_size, 3) if max_pool_size else None,
+            }
+            total_open += counts["open"]
+            total_in_use += counts["in_use"]
+        capacity = max_pool_size * len(servers)
+        stats = {
+            "connected": self.is_connected,
+            "open": total_open,
+            "in_use": total_in_use,
+            "available": max(total_open - total_in_use, 0),
+            "max_pool_size": max_pool_size,
+            "utilisation": round(total_in_use / capacity, 3) if capacity else None,
+            "read_preference": settings.MONGO_READ_PREFERENCE,
+            "max_staleness_seconds": settings.MONGO_MAX_STALENESS_SECONDS,
+        }
+        if include_servers:
+            stats["servers"] = servers
+        return stats
+
+
+mongo = MongoConnectionManager()
+
+
+def get_db() -> Database:
+    return mongo.db
+
+
+def get_read_db() -> Database:
+    return mongo.read_db
+
+
+def get_users_collection() -> Collection:
+    return mongo.db["users"]
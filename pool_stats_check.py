@@ -0,0 +1,68 @@
+# pool_stats_check.py
+# Sanity checks for the Mongo connection manager's pure logic: pool utilisation
+# tracking and read preference validation. Needs no running MongoDB.
+# Run: python pool_stats_check.py
+from types import SimpleNamespace
+
+from pymongo.read_preferences import Primary, SecondaryPreferred
+from backend.utils.db_connection import MongoConnectionManager, _build_read_preference
+
+A = ("db1.example.com", 27017)
+B = ("db2.example.com", 27017)
+
+
+def event(address):
+    return SimpleNamespace(address=address)
+
+
+def check_pool_counts():
+    manager = MongoConnectionManager()
+    listener = manager._pool_listener
+
+    listener.pool_created(event(A))
+    listener.pool_created(event(B))
+    for _ in range(3):
+        listener.connection_created(event(A))
+        listener.connection_checked_out(event(A))
+    listener.connection_created(event(B))
+    listener.connection_checked_out(event(B))
+    listener.connection_checked_in(event(A))
+
+    stats = manager.pool_stats(include_servers=True)
+    assert stats["open"] == 4 and stats["in_use"] == 3 and stats["available"] == 1, stats
+    assert stats["servers"]["db1.example.com:27017"]["in_use"] == 2, stats
+    assert stats["servers"]["db2.example.com:27017"]["in_use"] == 1, stats
+    assert "servers" not in manager.pool_stats(), "per-server breakdown must be opt-in"
+
+    # client.close(): pool_closed can be followed by late checkin/close events
+    listener.pool_closed(event(A))
+    listener.connection_checked_in(event(A))
+    listener.connection_closed(event(A))
+    listener.connection_checked_out(event(A))
+    stats = manager.pool_stats(include_servers=True)
+    assert list(stats["servers"]) == ["db2.example.com:27017"], stats
+    assert stats["open"] == 1 and stats["in_use"] == 1, stats
+
+    # counts never go negative
+    listener.connection_checked_in(event(B))
+    listener.connection_checked_in(event(B))
+    assert manager.pool_stats()["in_use"] == 0
+
+
+def check_read_preference():
+    assert isinstance(_build_read_preference("primary", 90), Primary)
+    pref = _build_read_preference("secondaryPreferred", 90)
+    assert isinstance(pref, SecondaryPreferred) and pref.max_staleness == 90
+    assert _build_read_preference("nearest", -1).max_staleness == -1
+    for name, staleness in (("bogus", 90), ("secondary", 0), ("secondary", 89), ("primary", 30)):
+        try:
+            _build_read_preference(name, staleness)
+        except ValueError:
+            continue
+        raise AssertionError(f"expected ValueError for {name!r}, {staleness}")
+
+
+if __name__ == "__main__":
+    check_pool_counts()
+    check_read_preference()
+    print("pool stats and read preference checks passed")
@@ -3,11 +3,12 @@ from fastapi import FastAPI
 from fastapi.middleware.wsgi import WSGIMiddleware
 from fastapi.testclient import TestClient
 
-from backend.main import app as fastapi_app
+from backend.main import app as fastapi_app, lifespan
 from frontend.app import app as flask_app
 
-# Main FastAPI app
-app = FastAPI(title="NoteVault Unified App")
+# Main FastAPI app. Mounted sub-apps don't get their own lifespan events,
+# so the backend's startup/shutdown (Mongo connection setup) runs here.
+app = FastAPI(title="NoteVault Unified App", lifespan=lifespan)
 
 # Mount backend
 app.mount("/api", fastapi_app)